@@ -7,6 +7,9 @@ REM Command file for Sphinx documentation
 if "%SPHINXBUILD%" == "" (
     set SPHINXBUILD=python -m sphinx
 )
+if "%SPHINXOPTS%" == "" (
+    set SPHINXOPTS=-j auto
+)
 set SOURCEDIR=source
 set BUILDDIR=build
 
@@ -5,40 +5,6 @@
 
 import sys
 import os
-from unittest.mock import MagicMock
-
-# Define a mock class for all the hardware-related modules
-class Mock(MagicMock):
-    @classmethod
-    def __getattr__(cls, name):
-        return MagicMock()
-
-# List of modules to mock
-MOCK_MODULES = [
-    'RPi', 'RPi.GPIO', 
-    'dht11', 
-    'board', 
-    'digitalio', 
-    'busio',
-    'adafruit_character_lcd', 
-    'adafruit_character_lcd.character_lcd_i2c',
-    'adafruit_mcp3xxx', 
-    'adafruit_mcp3xxx.mcp3008', 
-    'adafruit_mcp3xxx.analog_in',
-    'adafruit_ht16k33', 
-    'adafruit_ht16k33.segments',
-    'luma.led_matrix', 
-    'luma.led_matrix.device',
-    'luma.core.interface.serial',
-    'luma.core.render',
-    'smbus'
-]
-
-# Apply the mocks to the modules
-sys.modules.update((mod_name, Mock()) for mod_name in MOCK_MODULES)
-
-# Add the project root directory to the Python path so Sphinx can find the modules
-sys.path.insert(0, os.path.abspath('../..'))
 
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
@@ -53,23 +19,19 @@ release = '3.0.0'
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
 extensions = [
-    'sphinx.ext.autodoc',      # To generate documentation from docstrings
+    'autoapi.extension',       # To generate documentation from docstrings without importing the modules
     'sphinx.ext.viewcode',     # To include "view source" links
     'sphinx.ext.napoleon',     # (Optional) For Google/NumPy style docstrings
     'sphinx.ext.autosummary',  # (Optional) For summary tables
     'sphinx_simplepdf',
 ]
 
-# Configure autodoc to handle missing dependencies gracefully
-autodoc_mock_imports = MOCK_MODULES
-
-# Ensure imported modules appear in the docs even if they can't be imported
-autodoc_default_options = {
-    'members': True,
-    'undoc-members': True,
-    'show-inheritance': True,
-    'imported-members': True,
-}
+# sphinx-autoapi parses the sources statically, so the Raspberry Pi hardware
+# modules (RPi.GPIO, board, adafruit_*, luma.*, smbus, ...) never need to be imported or mocked
+autoapi_type = 'python'
+autoapi_dirs = ['../../greenhouse', '../../school_logging']
+autoapi_generate_api_docs = False  # The API pages are written by hand in messdaten.rst
+autoapi_add_toctree_entry = False
 
 simplepdf_vars = {
     'primary': '#336633',  # Example primary color
@@ -104,6 +66,11 @@ html_static_path = ['_static']
 
 # -- Path setup --------------------------------------------------------------
 
-sys.path.insert(0, os.path.abspath('../../'))  # Go up two levels from 'doc/source' to the project root
-sys.path.insert(0, os.path.abspath('../../greenhouse'))  # Path to DB module
-sys.path.insert(0, os.path.abspath('../../school_logging'))  # Path to the 'school_logging' directory
+# Only add each path once, so repeated loads of conf.py (e.g. during parallel builds) don't grow sys.path
+for path in (
+    os.path.abspath('../../'),  # Go up two levels from 'doc/source' to the project root
+    os.path.abspath('../../greenhouse'),  # Path to DB module
+    os.path.abspath('../../school_logging'),  # Path to the 'school_logging' directory
+):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -18,9 +18,10 @@ Befehlszeilenargumente:
 - --verbose: Legt den Log-Level fest (DEBUG, INFO, WARNING, ERROR, CRITICAL)
 - --iterations: Anzahl der durchzuführenden Messungen (Standard: 10)
 - --interval: Zeit zwischen den Messungen in Sekunden (Standard: 3)
+- --batch-size: Anzahl der Messungen pro Datenbank-Transaktion (Standard: 10)
 
 Verwendung:
-  python3 main.py [--verbose LEVEL] [--iterations ANZAHL] [--interval SEKUNDEN]
+  python3 main.py [--verbose LEVEL] [--iterations ANZAHL] [--interval SEKUNDEN] [--batch-size ANZAHL]
 
 Beispiel:
   python3 main.py --verbose INFO --iterations 20 --interval 5
@@ -28,6 +29,7 @@ Beispiel:
 
 import argparse
 import time
+from concurrent.futures import ThreadPoolExecutor
 import RPi.GPIO as GPIO
 import dht11
 
@@ -35,6 +37,8 @@ from school_logging.log import ColoredLogger
 
 from greenhouse.messdaten import MeasurementSystem
 
+FLUSH_FAILED_MESSAGE = "Speichern der Messungen fehlgeschlagen. Datenintegrität könnte beeinträchtigt sein."
+
 def parse_args() -> argparse.Namespace:
     """
     Verarbeitet Befehlszeilenargumente für das Datenbankoperationsskript.
@@ -51,6 +55,8 @@ def parse_args() -> argparse.Namespace:
                         help='Anzahl der durchzuführenden Messungen')
     parser.add_argument('--interval', type=int, default=3,
                         help='Intervall zwischen Messungen in Sekunden')
+    parser.add_argument('--batch-size', type=int, default=MeasurementSystem.BATCH_SIZE,
+                        help='Anzahl der Messungen, die gemeinsam in einer Transaktion gespeichert werden')
     args = parser.parse_args()
     return args
 
@@ -64,13 +70,16 @@ def main():
     log.info("Starte Gewächshaus-Kontrollsystem")
     log.info("Initialisiere Komponenten...")
     
+    # Noch nicht gespeicherte Messungen für die gebündelte Speicherung
+    pending_rows = []
+    
     try:
         # Datenbank-Operationen mit besserer Fehlerbehandlung initialisieren
         db_ops = None
         try:
             db_ops = MeasurementSystem(log)
         except Exception as e:
-            log.error(f"Fehler bei der Initialisierung der Datenbankoperationen: {e}")
+            log.error("Fehler bei der Initialisierung der Datenbankoperationen: %s", e)
             return
         
         # Nur fortfahren, wenn Datenbankoperationen erfolgreich initialisiert wurden
@@ -80,27 +89,58 @@ def main():
             GPIO.setmode(GPIO.BCM)
             instance = dht11.DHT11(pin=db_ops.DHT11_PIN)
             
-            # Datenbank erstellen, falls sie nicht existiert
-            db_ops.create_database()
-            
             # Hauptmessschleife
-            log.info(f"Starte {args.iterations} Messungen mit {args.interval}s Intervall")
-            for i in range(args.iterations):
-                log.info(f"Messung {i+1}/{args.iterations}")
-                
-                # Sensordaten auslesen
-                temperature, humidity = db_ops.read_dht11_sensor(instance)
-                log.info(f"Gemessen: Temperatur={temperature}°C, Luftfeuchtigkeit={humidity}%")
-                
-                # Messungen in Datenbank speichern und Helligkeit erhalten
-                brightness = db_ops.save_measurement(temperature, humidity)
-                
-                # Alle Anzeigen aktualisieren
-                if brightness is not None:
-                    db_ops.update_all_displays(temperature, humidity, brightness)
-                
-                # Vor der nächsten Messung warten
-                time.sleep(args.interval)
+            log.info("Starte %s Messungen mit %ss Intervall", args.iterations, args.interval)
+            # NTP-Abfrage und Datenbank-Schreibvorgänge laufen in Hilfsthreads parallel zum Auslesen des DHT11
+            flush_future = None
+            # Feste Taktung: Die Dauer einer Messung wird von der Wartezeit abgezogen
+            next_time = time.monotonic()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                for i in range(args.iterations):
+                    # Fehlgeschlagenen Schreibvorgang im Hintergrund sofort melden und abbrechen
+                    if flush_future is not None and flush_future.done():
+                        if not flush_future.result():
+                            log.critical(FLUSH_FAILED_MESSAGE)
+                        flush_future = None
+                    
+                    log.info("Messung %s/%s", i+1, args.iterations)
+                    
+                    # Zeitstempel im Hintergrund abfragen
+                    ntp_future = executor.submit(db_ops.get_ntp_time, db_ops.TIME_SERVER)
+                    
+                    # Sensordaten auslesen
+                    temperature, humidity = db_ops.read_dht11_sensor(instance)
+                    log.info("Gemessen: Temperatur=%s°C, Luftfeuchtigkeit=%s%%", temperature, humidity)
+                    
+                    # Messung mit Zeitstempel und Helligkeit erfassen und zwischenspeichern
+                    row = db_ops.collect_measurement(temperature, humidity, ntp_future.result())
+                    
+                    pending_rows.append(row)
+                    
+                    # Alle Anzeigen im Hintergrund aktualisieren
+                    db_ops.submit_display_update(temperature, humidity, row[3])
+                    
+                    # Gepufferte Messungen gebündelt im Hintergrund in die Datenbank schreiben
+                    if len(pending_rows) >= args.batch_size:
+                        if flush_future is not None and not flush_future.result():
+                            log.critical(FLUSH_FAILED_MESSAGE)
+                        flush_future = executor.submit(db_ops.save_measurements, pending_rows)
+                        pending_rows = []
+                    
+                    # Nur die verbleibende Zeit bis zur nächsten Messung warten
+                    next_time += args.interval
+                    delay = next_time - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+            
+                if flush_future is not None and not flush_future.result():
+                    log.critical(FLUSH_FAILED_MESSAGE)
+            
+            # Restliche Messungen speichern
+            saved = db_ops.save_measurements(pending_rows)
+            pending_rows.clear()
+            if not saved:
+                log.critical(FLUSH_FAILED_MESSAGE)
             
             # Datenbankinhalt ausgeben
             db_ops.print_database()
@@ -111,17 +151,28 @@ def main():
         log.info("Gewächshaus-Kontrollsystem durch Benutzer gestoppt")
         
     except Exception as e:
-        log.critical(f"Ein unerwarteter Fehler ist aufgetreten: {e}", exc_info=True)
+        log.critical("Ein unerwarteter Fehler ist aufgetreten: %s", e, exc_info=True)
 
     finally:
         log.info("Räume Ressourcen auf...")
-        if 'db_ops' in locals() and db_ops is not None:
-            db_ops.close_connection()
         try:
-            GPIO.cleanup()
-        except:
-            pass
-        log.info("Gewächshaus-Kontrollsystem wurde angehalten")
+            if 'db_ops' in locals() and db_ops is not None:
+                db_ops.stop_display_worker()
+                # Bei Abbruch bereits erfasste Messungen nicht verlieren; ein Fehler hier
+                # darf das Schließen der Datenbank und das Freigeben der GPIOs nicht verhindern
+                try:
+                    if not db_ops.save_measurements(pending_rows):
+                        log.error("Restliche Messungen konnten nicht gespeichert werden.")
+                except Exception as e:
+                    log.error("Fehler beim Speichern der restlichen Messungen: %s", e)
+                finally:
+                    db_ops.close_connection()
+        finally:
+            try:
+                GPIO.cleanup()
+            except:
+                pass
+            log.info("Gewächshaus-Kontrollsystem wurde angehalten")
 
 if __name__ == "__main__":
     main()
@@ -16,12 +16,17 @@ Dieses Modul bildet das Herzstück des Gewächshaus-Überwachungssystems und
 """
 
 import time
+import queue
+import socket
+import logging
+import threading
 import sqlite3
-from typing import Optional
-from datetime import datetime, timezone
+from itertools import chain, islice
+from typing import List, Optional, Tuple
+from datetime import datetime
+from functools import cached_property
+from zoneinfo import ZoneInfo
 import ntplib
-import requests
-import pytz
 import RPi.GPIO as GPIO
 import board
 import digitalio
@@ -44,8 +49,9 @@ class MeasurementSystem:
     - Anzeige von Informationen auf verschiedenen Display-Typen
     - Überwachung des Tag/Nacht-Zyklus basierend auf Helligkeitsmessungen
     
-    Die Klasse initialisiert bei ihrer Erstellung alle benötigten Hardware-Komponenten
-    und ermöglicht die zentrale Steuerung sämtlicher Sensoren und Anzeigeelemente.
+    Die Hardware-Komponenten werden erst beim ersten Zugriff initialisiert, sodass
+    reine Datenbankoperationen ohne Hardware-Zugriff auskommen. Die Klasse ermöglicht
+    die zentrale Steuerung sämtlicher Sensoren und Anzeigeelemente.
     
     Attribute:
         conn: Verbindung zur SQLite-Datenbank
@@ -53,18 +59,65 @@ class MeasurementSystem:
         matrix: LED-Matrix-Display für grafische Symbole
         seven_segment: 7-Segment-Display für numerische Werte
         brightness_channel: Kanal für Helligkeitsmessungen
+        bh1750_bus: I2C-Bus des BH1750-Lichtsensors (None, wenn nicht verfügbar)
         temperature: Aktuelle Temperatur
         humidity: Aktuelle Luftfeuchtigkeit
     """
     # --- Konfiguration ---
     DATABASE_FILE: str = "greenhouse.db"
     TIME_SERVER: str = '10.254.5.115'  # Bei Bedarf NTP-Server anpassen eg. google '216.239.35.0'
+    NTP_TIMEOUT: float = 2.0  # Timeout einer NTP-Anfrage in Sekunden
+    NTP_ATTEMPTS: int = 2  # Anzahl der NTP-Anfrageversuche
+    NTP_RESYNC_INTERVAL: float = 3600.0  # Sekunden bis zur erneuten NTP-Synchronisierung
+    NTP_RETRY_INTERVAL: float = 60.0  # Sekunden bis zum nächsten Versuch nach einer fehlgeschlagenen Synchronisierung
+    TIMEZONE: str = 'Europe/Berlin'  # Lokale Zeitzone des Gewächshauses
     NUM_ITERATIONS = 3  # Anzahl der Messzyklen für Datenerfassung
+    BATCH_SIZE = 10  # Anzahl der Messungen, die gemeinsam in einer Transaktion gespeichert werden
+    PRINT_BLOCK_SIZE = 500  # Zeilen pro Protokolleintrag in print_database
+    PRINT_COLUMNS = ('id', 'timestamp', 'temperature', 'humidity', 'brightness')  # Ausgegebene Spalten in print_database
     DHT11_PIN = 4  # GPIO-Pin für den DHT11-Sensor
+    DHT11_READ_BUDGET = 1.0  # Maximale Gesamtdauer (s) für DHT11-Leseversuche
+    DHT11_INITIAL_DELAY = 0.1  # Erste Wartezeit (s) zwischen DHT11-Leseversuchen
+    DHT11_MAX_DELAY = 0.4  # Obergrenze (s) für die Wartezeit zwischen Leseversuchen
     LCD_COLUMNS = 16
     LCD_ROWS = 2
     LCD_I2C_ADDRESS = 0x21  # I2C-Adresse des LCD-Displays anpassen
+    LCD_TEMPLATE = "Temp:      C\nFeuchte:      %"  # Feste Beschriftung, wird nur einmal geschrieben
+    LCD_TEMP_POSITION = (6, 0)  # Spalte und Zeile des Temperaturwerts
+    LCD_HUM_POSITION = (9, 1)  # Spalte und Zeile des Luftfeuchtigkeitswerts
     SEVEN_SEGMENT_I2C_ADDRESS = 0x70  # I2C-Adresse des 7-Segment-Displays
+    BH1750_I2C_ADDRESS = 0x5c  # Standard-I2C-Adresse des BH1750-Lichtsensors
+    BH1750_ONE_TIME_HIGH_RES_MODE_1 = 0x20  # Hochauflösungsmodus des BH1750
+    MCP3008_REFERENCE_VOLTAGE = 3.3  # Referenzspannung des MCP3008 (Standard der Adafruit-Bibliothek)
+
+    # Sonnen- und Mond-Bitmaps (8x8) für das Matrix-Display, eine Zeile pro Byte
+    SUN_BITMAP = (
+        0b00111100,
+        0b01111110,
+        0b11111111,
+        0b11111111,
+        0b11111111,
+        0b01111110,
+        0b00111100,
+        0b00000000,
+    )
+    MOON_BITMAP = (
+        0b00111100,
+        0b01111110,
+        0b01110000,
+        0b01100000,
+        0b01100000,
+        0b01110000,
+        0b01111110,
+        0b00111100,
+    )
+    SEVEN_SEGMENT_TOGGLE_INTERVAL = 1.0  # Sekunden bis zum Wechsel zwischen Temperatur und Luftfeuchtigkeit
+    DAY_BRIGHTNESS_THRESHOLD = 100  # Ab diesem Helligkeitswert wird das Tagessymbol angezeigt
+    DISPLAY_TEMP_EPSILON = 0.1  # Minimale Temperaturänderung (°C) für eine Neuanzeige
+    DISPLAY_HUM_EPSILON = 0.5  # Minimale Änderung der Luftfeuchtigkeit (%) für eine Neuanzeige
+    INSERT_SQL: str = "INSERT INTO measurements (timestamp, temperature, humidity, brightness) VALUES "
+    INSERT_ROW_PLACEHOLDER: str = "(?, ?, ?, ?)"
+    MAX_ROWS_PER_INSERT = 999 // 4  # SQLite erlaubt (je nach Version) mindestens 999 Parameter pro Anweisung
 
     # --- Globale Variablen ---
     log = None  # Globale Logger-Instanz
@@ -73,19 +126,74 @@ class MeasurementSystem:
     def __init__(self, log: ColoredLogger) -> None:
         self.log = log
         self.conn = None
-        self.lcd = self.initialize_lcd()
-        self.brightness_channel = self.initialize_brightness_sensor()
-        self.matrix = self.initialize_matrix_display()
-        self.seven_segment = self.initialize_seven_segment()
+        self._cursor = None  # Wiederverwendeter Cursor für Einfügeoperationen
+        self._insert_sql_cache = {}  # Mehrzeilige INSERT-Anweisungen je Zeilenanzahl
+        self._db_lock = threading.Lock()  # Serialisiert Datenbankzugriffe verschiedener Threads
+        self._ntp_client = ntplib.NTPClient()
+        self._ntp_offset = None  # Versatz zwischen NTP-Zeit und monotoner Uhr
+        self._ntp_next_sync = 0.0  # Monotoner Zeitpunkt der nächsten NTP-Synchronisierung
+        self._tz = None  # Einmalig ermittelte Zeitzone
+        self._display_queue = queue.Queue(maxsize=1)  # Aktuellste Werte für den Anzeige-Thread
+        self._display_thread = None
+        self._last_display_values = None  # Zuletzt an die Anzeigen übergebene Werte
+        self._matrix_symbols = None  # Vorbereitete Symbolbilder für das Matrix-Display
+        self._matrix_day_mode = None  # Zuletzt angezeigtes Symbol (True = Tag, False = Nacht)
+        self._seven_segment_warned = False  # Wurde das Fehlen des 7-Segment-Displays bereits gemeldet?
+        self._lcd_texts = None  # Zuletzt geschriebene LCD-Werte (None: Beschriftung noch nicht geschrieben)
         self.connect_to_database()
 
+    # --- Hardware-Komponenten (Initialisierung erst beim ersten Zugriff) ---
+    @cached_property
+    def lcd(self):
+        """LCD-Display-Objekt, wird beim ersten Zugriff initialisiert."""
+        return self.initialize_lcd()
+
+    @cached_property
+    def brightness_channel(self):
+        """Analoger Helligkeitskanal, wird beim ersten Zugriff initialisiert."""
+        return self.initialize_brightness_sensor()
+
+    @cached_property
+    def bh1750_bus(self):
+        """I2C-Bus des BH1750-Sensors, wird beim ersten Zugriff initialisiert."""
+        return self.initialize_bh1750()
+
+    @cached_property
+    def matrix(self):
+        """LED-Matrix-Display, wird beim ersten Zugriff initialisiert."""
+        return self.initialize_matrix_display()
+
+    @cached_property
+    def seven_segment(self):
+        """7-Segment-Display, wird beim ersten Zugriff initialisiert."""
+        return self.initialize_seven_segment()
+
     def connect_to_database(self) -> None:
         """
-        Stellt eine Verbindung zur SQLite-Datenbank her.
+        Stellt eine Verbindung zur SQLite-Datenbank her und legt die Tabelle bei Bedarf an.
         """
         try:
-            self.conn = sqlite3.connect('greenhouse.db')
+            # Die Verbindung wird mit Hilfsthreads geteilt; Zugriffe werden über _db_lock serialisiert
+            self.conn = sqlite3.connect(self.DATABASE_FILE, check_same_thread=False)
+            # Wirkt nur bei neuen Datenbanken (vor dem Anlegen der ersten Tabelle)
+            self.conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            # WAL-Modus: Commits hängen nur an das Log an, statt das Journal neu zu schreiben
+            # (für In-Memory-Datenbanken nicht verfügbar)
+            if self.DATABASE_FILE != ':memory:':
+                journal_mode = self.conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+                if journal_mode.lower() != 'wal':
+                    self.log.warning("WAL-Modus nicht verfügbar, verwende Journal-Modus '%s'.", journal_mode)
+                else:
+                    self.log.debug("Datenbank-Journal-Modus: %s", journal_mode)
+            self.conn.execute("PRAGMA synchronous=NORMAL")  # fsync nur beim Checkpoint
+            self.conn.execute("PRAGMA temp_store=MEMORY")
+            self.conn.execute("PRAGMA mmap_size=67108864")  # 64 MB Memory-Mapped I/O
+            self.conn.execute("PRAGMA cache_size=-20000")  # ca. 20 MB Seitencache
+            # Einen Cursor für alle Einfügeoperationen wiederverwenden
+            self._cursor = self.conn.cursor()
             self.log.info("Verbindung zur Datenbank erfolgreich hergestellt.")
+            # Schema einmalig direkt nach dem Verbinden sicherstellen
+            self.create_database()
         except sqlite3.Error as e:
             self.log.error("Fehler beim Verbinden zur Datenbank: %s", e)
             self.conn = None
@@ -95,94 +203,142 @@ class MeasurementSystem:
         Erstellt die Datenbanktabelle, falls sie nicht existiert.
         """
         try:
-            cursor = self.conn.cursor()
-
-            # Überprüfen, ob die Tabelle existiert
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='measurements'")
-            table_exists = cursor.fetchone() is not None
-
-            # Tabelle erstellen, falls sie nicht existiert
-            if not table_exists:
-                cursor.execute("""
-                    CREATE TABLE measurements (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            # Alle Schemaänderungen in einer Transaktion; Commit/Rollback übernimmt der Kontextmanager.
+            # sqlite3 beginnt Transaktionen nur vor DML implizit, daher hier explizit BEGIN
+            with self._db_lock, self.conn:
+                self.conn.execute("BEGIN")
+                # Tabelle erstellen, falls sie nicht existiert; ohne AUTOINCREMENT dient die
+                # interne rowid als id und sqlite_sequence muss nicht bei jedem Einfügen gepflegt werden
+                self.conn.execute("""
+                    CREATE TABLE IF NOT EXISTS measurements (
+                        id INTEGER PRIMARY KEY,
+                        timestamp INTEGER NOT NULL,
                         temperature REAL,
                         humidity REAL,
                         brightness INTEGER
                     )
                 """)
-                self.conn.commit()
-                self.log.info("Tabelle 'measurements' wurde erstellt.")
-            else:
-                # Prüfen, ob die Helligkeitsspalte existiert
-                cursor.execute("PRAGMA table_info(measurements)")
-                columns = [column[1] for column in cursor.fetchall()]
-                
-                # Helligkeitsspalte hinzufügen, falls sie nicht existiert
-                if 'brightness' not in columns:
-                    cursor.execute("ALTER TABLE measurements ADD COLUMN brightness INTEGER")
-                    self.conn.commit()
+
+                # Index für Zeitbereichsabfragen und Sortierung nach Zeitstempel
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_measurements_ts ON measurements(timestamp)")
+
+                # Helligkeitsspalte bei älteren Datenbanken nachrüsten; existiert sie bereits,
+                # meldet SQLite eine doppelte Spalte und es ist nichts zu tun
+                try:
+                    self.conn.execute("ALTER TABLE measurements ADD COLUMN brightness INTEGER")
                     self.log.info("Helligkeitsspalte zur bestehenden Tabelle hinzugefügt.")
-                else:
-                    self.log.info("Tabelle 'measurements' mit Helligkeitsspalte existiert bereits.")
+                except sqlite3.OperationalError as e:
+                    if 'duplicate column' not in str(e):
+                        raise
+
+                # Index für Abfragen nach Helligkeit (z.B. Tag/Nacht-Auswertungen)
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_measurements_brightness ON measurements(brightness)")
+
+            self.log.info("Tabelle 'measurements' ist bereit.")
         except sqlite3.Error as e:
             self.log.error("Fehler beim Erstellen/Aktualisieren der Tabelle: %s", e)
 
-    def save_measurement(self, temp: float, hum: float) -> Optional[int]:
+    def collect_measurement(self, temp: float, hum: float,
+                            ntp_time: Optional[int] = None) -> Tuple[int, float, float, int]:
         """
-        Speichert eine Messung in der Datenbank.
+        Erfasst Zeitstempel und Helligkeit zu einer Messung, ohne sie zu speichern.
 
         Args:
             temp (float): Die gemessene Temperatur.
             hum (float): Die gemessene Luftfeuchtigkeit.
+            ntp_time (Optional[int]): Bereits ermittelter Zeitstempel, z.B. parallel zum
+                Sensorauslesen abgefragt. Ohne Angabe wird die NTP-Zeit hier abgerufen.
+
+        Returns:
+            Tuple[int, float, float, int]: Datensatz (Zeitstempel, Temperatur,
+            Luftfeuchtigkeit, Helligkeit).
+        """
+        if ntp_time is None:
+            ntp_time = self.get_ntp_time(self.TIME_SERVER)
+
+        # Helligkeit auslesen
+        brightness = self.read_brightness()
+        self.log.debug("Helligkeitsmessung: %s", brightness)
+        return ntp_time, temp, hum, brightness
+
+    def save_measurements(self, rows: List[Tuple[int, float, float, int]]) -> bool:
+        """
+        Speichert mehrere Messungen gebündelt in einer einzigen Transaktion.
+
+        Fehler werden nur als ERROR protokolliert und über den Rückgabewert gemeldet,
+        da die Methode auch in Hilfsthreads läuft. Über den Abbruch entscheidet der Aufrufer.
+
+        Args:
+            rows (List[Tuple[int, float, float, int]]): Datensätze aus collect_measurement.
+
+        Returns:
+            bool: True, wenn alle Messungen gespeichert wurden.
         """
+        # Nichts zu speichern ist auch ohne Datenbankverbindung kein Fehler (z.B. beim Aufräumen)
+        if not rows:
+            return True
         if self.conn is None:
             self.log.error("Datenbankverbindung ist nicht hergestellt.")
-            return
-
-        ntp_time = self.get_ntp_time(self.TIME_SERVER)
-        if ntp_time is None:
-            self.log.error("Konnte keine Zeit vom NTP-Server abrufen. Messung nicht gespeichert.")
-            return
+            return False
 
         try:
-            # Helligkeit auslesen
-            brightness = self.read_brightness() 
-            self.log.info(f"Helligkeitsmessung: {brightness}")
-            
-            # In Datenbank speichern
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "INSERT INTO measurements (timestamp, temperature, humidity, brightness) VALUES (?, ?, ?, ?)",
-                (ntp_time, temp, hum, brightness)
-            )
-            self.conn.commit()
-            self.log.info(f"Messung gespeichert: Temperatur={temp:.1f}, Luftfeuchtigkeit={hum:.1f}, Helligkeit={brightness} um {ntp_time}")
-            
-            return brightness  # Helligkeit für Anzeigeaktualisierung zurückgeben
-            
+            # Ein Commit für alle Zeilen statt einem pro Messung
+            with self._db_lock, self.conn:
+                # Mehrzeiliges INSERT ... VALUES (...), (...) statt einer Anweisung pro Zeile
+                for start in range(0, len(rows), self.MAX_ROWS_PER_INSERT):
+                    chunk = rows[start:start + self.MAX_ROWS_PER_INSERT]
+                    sql = self._insert_sql_cache.get(len(chunk))
+                    if sql is None:
+                        sql = self.INSERT_SQL + ", ".join([self.INSERT_ROW_PLACEHOLDER] * len(chunk))
+                        self._insert_sql_cache[len(chunk)] = sql
+                    self._cursor.execute(sql, list(chain.from_iterable(chunk)))
+            self.log.info("%d Messung(en) in der Datenbank gespeichert.", len(rows))
         except sqlite3.Error as e:
-            self.log.error(f"Fehler beim Speichern der Messung: {e}")
-            self.conn.rollback()
-            self.log.critical("Speichern der Messung fehlgeschlagen. Datenintegrität könnte beeinträchtigt sein.")
+            self.log.error("Fehler beim Speichern der Messungen: %s", e)
+            return False
+        return True
+
+    def save_measurement(self, temp: float, hum: float) -> Optional[int]:
+        """
+        Erfasst eine einzelne Messung und speichert sie sofort in der Datenbank.
+
+        Args:
+            temp (float): Die gemessene Temperatur.
+            hum (float): Die gemessene Luftfeuchtigkeit.
+
+        Returns:
+            Optional[int]: Die gemessene Helligkeit für die Anzeigeaktualisierung.
+        """
+        if self.conn is None:
+            self.log.error("Datenbankverbindung ist nicht hergestellt.")
             return None
 
+        row = self.collect_measurement(temp, hum)
+        if not self.save_measurements([row]):
+            self.log.critical("Speichern der Messung fehlgeschlagen. Datenintegrität könnte beeinträchtigt sein.")
+        return row[3]
+
     # --- Sensorauslesen ---
 
-    def read_dht11_sensor(self, instance, max_attempts=10):
+    def read_dht11_sensor(self, instance):
         """
         Liest Daten vom DHT11-Sensor und gibt Temperatur und Luftfeuchtigkeit zurück.
+
+        Fehlgeschlagene Lesevorgänge werden mit exponentiell wachsender Wartezeit
+        wiederholt, bis das Zeitbudget DHT11_READ_BUDGET aufgebraucht ist.
         """
+        deadline = time.monotonic() + self.DHT11_READ_BUDGET
+        delay = self.DHT11_INITIAL_DELAY
+        attempts = 1
         result = instance.read()
-        attempts = 0
-        while not result.is_valid() and attempts < max_attempts:
+        while not result.is_valid() and time.monotonic() + delay < deadline:
+            time.sleep(delay)
+            delay = min(delay * 1.5, self.DHT11_MAX_DELAY)
             attempts += 1
             result = instance.read()
-            time.sleep(0.5)
         
         if not result.is_valid():
-            self.log.warning(f"Keine gültigen Werte nach {max_attempts} Versuchen erhalten")
+            self.log.warning("Keine gültigen Werte nach %s Versuchen erhalten", attempts)
             # Letzte Werte oder Standardwerte zurückgeben
             return self.temperature or 20.0, self.humidity or 50.0
         
@@ -200,72 +356,162 @@ class MeasurementSystem:
             self.log.error("Datenbankverbindung ist nicht hergestellt.")
             return
 
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM measurements")
-        rows = cursor.fetchall()
-
-        if not rows:
-            self.log.info("Die Tabelle 'measurements' ist leer.")
+        # Die Ausgabe erfolgt auf INFO-Stufe; ist diese deaktiviert, ist nichts zu tun
+        if not self.log.logger.isEnabledFor(logging.INFO):
             return
 
-        # Spaltennamen holen
-        column_names = [description[0] for description in cursor.description]
+        # Lesen während eines laufenden Schreibvorgangs im Hintergrund verhindern
+        with self._db_lock:
+            column_names = self.PRINT_COLUMNS
+            # Werte werden bereits in SQLite in Text umgewandelt, damit Breitenberechnung und
+            # Ausgabe dieselbe Darstellung verwenden (SQLite und Python formatieren REAL-Werte
+            # unterschiedlich). Nur der Zeitstempel wird roh gelesen und in Python formatiert.
+            text_columns = [
+                name if name == 'timestamp' else f"COALESCE(CAST({name} AS TEXT), 'None')"
+                for name in column_names
+            ]
+            cursor = self.conn.cursor()
+            # Feste Spaltenliste; Sortierung nach id liest die Tabelle in Seitenreihenfolge
+            cursor.execute(f"SELECT {', '.join(text_columns)} FROM measurements ORDER BY id")
 
-        # Maximale Breite für jede Spalte berechnen
-        column_widths = [len(name) for name in column_names]
-        for row in rows:
-            for i, value in enumerate(row):
-                column_widths[i] = max(column_widths[i], len(str(value)))
+            # Zeilenanzahl und maximale Breite je Spalte direkt in SQLite berechnen,
+            # damit die Zeilen anschließend gestreamt werden können
+            width_sql = ", ".join(
+                f"MAX(LENGTH(COALESCE(CAST({name} AS TEXT), 'None')))" for name in column_names
+            )
+            row_count, *max_lengths = self.conn.execute(
+                f"SELECT COUNT(*), {width_sql} FROM measurements"
+            ).fetchone()
+
+            if not row_count:
+                self.log.info("Die Tabelle 'measurements' ist leer.")
+                return
+
+            column_widths = [max(len(name), length) for name, length in zip(column_names, max_lengths)]
+            # Zeitstempel werden als Millisekunden gespeichert, aber formatiert angezeigt
+            ts_index = column_names.index('timestamp')
+            column_widths[ts_index] = max(column_widths[ts_index], len('YYYY-MM-DD HH:MM:SS'))
+            fmt = " | ".join(f"{{:<{width}}}" for width in column_widths)
+
+            header = fmt.format(*column_names)
+            self.log.info("%s\n%s", header, "-" * len(header))
+
+            # Zeilen blockweise aus dem Cursor ausgeben, ohne die ganze Tabelle zu laden
+            while True:
+                block = list(islice(cursor, self.PRINT_BLOCK_SIZE))
+                if not block:
+                    break
+                lines = []
+                for row in block:
+                    values = list(row)
+                    values[ts_index] = self.format_timestamp(row[ts_index])
+                    lines.append(fmt.format(*values))
+                self.log.info("%s", "\n".join(lines))
+
+    def get_ntp_time(self, ip_address: str) -> int:
+        """
+        Liefert die aktuelle Zeit des angegebenen NTP-Servers als Unix-Zeitstempel in Millisekunden.
+
+        Der NTP-Server wird nur beim ersten Aufruf und danach höchstens alle
+        NTP_RESYNC_INTERVAL Sekunden abgefragt. Dazwischen wird die Zeit aus dem
+        gespeicherten Versatz zur monotonen Systemuhr berechnet, sodass pro Messung keine
+        Netzwerkanfragen und keine Datumsformatierung mehr nötig sind. Ist der Server nicht
+        erreichbar, wird der letzte Versatz bzw. die lokale Systemzeit verwendet und erst
+        nach NTP_RETRY_INTERVAL Sekunden ein neuer Versuch unternommen.
 
-        # Überschrift ausgeben
-        header = " | ".join(f"{name:<{width}}" for name, width in zip(column_names, column_widths))
-        self.log.info(header)
-        self.log.info("-" * len(header))
+        Parameter:
+        ip_address (str): Die IP-Adresse des NTP-Servers.
+
+        Returns:
+        int: Die Serverzeit (UTC) in Millisekunden seit 1970.
+        """
+        now = time.monotonic()
+        if now >= self._ntp_next_sync:
+            try:
+                response = self._request_ntp(ip_address)
+                now = time.monotonic()
+                # Versatz zwischen Serverzeit (UTC) und monotoner Uhr merken
+                self._ntp_offset = response.tx_time - now
+                self._ntp_next_sync = now + self.NTP_RESYNC_INTERVAL
+                self.log.info("Zeit mit NTP-Server %s synchronisiert.", ip_address)
+            except (ntplib.NTPException, OSError) as e:
+                # OSError umfasst Zeitüberschreitungen, DNS- und Netzwerkfehler.
+                # Die fehlgeschlagene Anfrage kann mehrere Sekunden gedauert haben,
+                # daher die Uhr neu lesen, bevor Versatz und nächster Versuch berechnet werden
+                now = time.monotonic()
+                # Messschleife nicht blockieren: erst nach NTP_RETRY_INTERVAL erneut versuchen
+                self._ntp_next_sync = now + self.NTP_RETRY_INTERVAL
+                if self._ntp_offset is None:
+                    # Noch nie synchronisiert: vorerst die lokale Systemuhr verwenden
+                    self._ntp_offset = time.time() - now
+                    self.log.warning("Fehler beim Abrufen der NTP-Zeit: %s. Verwende lokale Systemzeit.", e)
+                else:
+                    self.log.warning("NTP-Neusynchronisierung fehlgeschlagen: %s. Verwende letzten Versatz.", e)
 
-        # Zeilen ausgeben
-        for row in rows:
-            row_str = " | ".join(f"{value:<{width}}" for value, width in zip(row, column_widths))
-            self.log.info(row_str)
+        return int((now + self._ntp_offset) * 1000)
 
-    def get_ntp_time(self, ip_address: str) -> Optional[str]:
+    def _request_ntp(self, ip_address: str):
         """
-        Ruft die Serverzeit vom angegebenen NTP-Server ab und konvertiert sie in die lokale Zeitzone.
+        Fragt den NTP-Server mit kurzem Timeout ab und wiederholt die Anfrage bei Fehlschlag.
 
         Parameter:
         ip_address (str): Die IP-Adresse des NTP-Servers.
 
         Returns:
-        str: Die formatierte lokale Zeit.
+        NTPStats: Die Antwort des NTP-Servers.
         """
-        try:
-            client = ntplib.NTPClient()
-            response = client.request(ip_address, version=3)
-            server_time = datetime.fromtimestamp(response.tx_time, timezone.utc)
-            
-            # Zeitzone für die IP-Adresse abrufen
+        for attempt in range(1, self.NTP_ATTEMPTS + 1):
             try:
-                response = requests.get(f"http://ip-api.com/json/{ip_address}")
-                data = response.json()
-                tz = pytz.timezone(data['timezone'])
-            except Exception as e:
-                self.log.warning(f"Konnte Zeitzone nicht bestimmen: {e}. Verwende UTC.")
-                tz = pytz.UTC
-                
-            local_time = server_time.astimezone(tz)
-            local_time_str = local_time.strftime('%Y-%m-%d %H:%M:%S')
-            self.log.info(f"Lokale Zeit: {local_time_str} auf Server: {ip_address}")
-            return local_time_str
-            
-        except Exception as e:
-            self.log.error(f"Fehler beim Abrufen der NTP-Zeit: {e}")
-            return None
+                return self._ntp_client.request(ip_address, version=3, timeout=self.NTP_TIMEOUT)
+            except (ntplib.NTPException, socket.timeout) as e:
+                if attempt == self.NTP_ATTEMPTS:
+                    raise
+                self.log.warning("NTP-Anfrage %s/%s fehlgeschlagen: %s", attempt, self.NTP_ATTEMPTS, e)
+
+    def get_timezone(self):
+        """
+        Liefert die konfigurierte lokale Zeitzone (siehe TIMEZONE).
+
+        Returns:
+        tzinfo: Die lokale Zeitzone.
+        """
+        if self._tz is None:
+            self._tz = ZoneInfo(self.TIMEZONE)
+        return self._tz
+
+    def format_timestamp(self, timestamp) -> str:
+        """
+        Wandelt einen gespeicherten Zeitstempel in lokale Zeit zur Anzeige um.
+
+        Args:
+            timestamp: Unix-Zeitstempel in Millisekunden oder ein älterer Text-Zeitstempel.
+
+        Returns:
+            str: Die formatierte lokale Zeit.
+        """
+        if not isinstance(timestamp, int):
+            # Ältere Einträge wurden bereits als Text gespeichert
+            return str(timestamp)
+        local_time = datetime.fromtimestamp(timestamp / 1000, self.get_timezone())
+        return local_time.replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
 
     def close_connection(self) -> None:
         """
         Schließt die Datenbankverbindung.
+
+        Zuvor werden freie Seiten per incremental_vacuum an das Dateisystem zurückgegeben
+        (wirksam bei Datenbanken, die mit auto_vacuum=INCREMENTAL angelegt wurden).
         """
         if self.conn:
-            self.conn.close()
+            with self._db_lock:
+                try:
+                    # Alle freien Seiten auf einmal freigeben; ohne diesen Aufruf bewirkt
+                    # auto_vacuum=INCREMENTAL keine Verkleinerung der Datei
+                    # executescript läuft die Anweisung vollständig ab (execute gäbe nur eine Seite frei)
+                    self.conn.executescript("PRAGMA incremental_vacuum;")
+                except sqlite3.Error as e:
+                    self.log.warning("Freigeben ungenutzter Datenbankseiten fehlgeschlagen: %s", e)
+                self.conn.close()
             self.log.info("Datenbankverbindung geschlossen.")
             
     def initialize_lcd(self):
@@ -283,24 +529,40 @@ class MeasurementSystem:
             self.log.info("LCD erfolgreich initialisiert mit eingeschalteter Hintergrundbeleuchtung.")
             return lcd
         except Exception as e:
-            self.log.error(f"Fehler bei LCD-Initialisierung: {e}")
+            self.log.error("Fehler bei LCD-Initialisierung: %s", e)
             # Mock-LCD-Objekt zurückgeben, um Abstürze zu vermeiden
-            return type('MockLCD', (), {'clear': lambda: None, 'message': ''})
+            return type('MockLCD', (), {'clear': lambda: None, 'cursor_position': lambda column, row: None, 'message': ''})
 
     def display_on_lcd(self, temperature, humidity):
         """
         Zeigt Temperatur und Luftfeuchtigkeit auf dem LCD an.
         
+        Die Beschriftung wird nur beim ersten Aufruf geschrieben; danach werden
+        lediglich geänderte Zahlenfelder überschrieben, ohne das Display zu löschen.
+        
         Args:
             temperature (float): Die anzuzeigende Temperatur.
             humidity (float): Die anzuzeigende Luftfeuchtigkeit.
         """
         try:
-            self.lcd.clear()
-            self.lcd.message = f"Temp: {temperature:.1f}C\nLuftfeuchte: {humidity:.1f}%"
-            self.log.info(f"Angezeigt auf LCD: Temp: {temperature:.1f}C, Luftfeuchte: {humidity:.1f}%")
+            if self._lcd_texts is None:
+                self.lcd.clear()
+                self.lcd.message = self.LCD_TEMPLATE
+                self._lcd_texts = (None, None)
+            # Werte mit fester Breite schreiben, damit alte Ziffern vollständig überschrieben werden
+            temp_text = f"{temperature:5.1f}"
+            hum_text = f"{humidity:5.1f}"
+            last_temp_text, last_hum_text = self._lcd_texts
+            if temp_text != last_temp_text:
+                self.lcd.cursor_position(*self.LCD_TEMP_POSITION)
+                self.lcd.message = temp_text
+            if hum_text != last_hum_text:
+                self.lcd.cursor_position(*self.LCD_HUM_POSITION)
+                self.lcd.message = hum_text
+            self._lcd_texts = (temp_text, hum_text)
+            self.log.info("Angezeigt auf LCD: Temp: %.1fC, Luftfeuchte: %.1f%%", temperature, humidity)
         except Exception as e:
-            self.log.error(f"Fehler bei der Anzeige auf LCD: {e}")
+            self.log.error("Fehler bei der Anzeige auf LCD: %s", e)
 
     def initialize_brightness_sensor(self):
         """
@@ -317,70 +579,88 @@ class MeasurementSystem:
             self.log.info("Helligkeitssensor erfolgreich initialisiert.")
             return channel
         except Exception as e:
-            self.log.error(f"Fehler bei der Initialisierung des Helligkeitssensors: {e}")
+            self.log.error("Fehler bei der Initialisierung des Helligkeitssensors: %s", e)
             # Mock-Sensor zurückgeben, um Abstürze zu vermeiden
             return type('MockSensor', (), {'value': 2000})
 
+    def initialize_bh1750(self):
+        """
+        Öffnet den I2C-Bus für den BH1750-Lichtsensor einmalig.
+        
+        Returns:
+            SMBus: Der geöffnete I2C-Bus oder None, wenn er nicht verfügbar ist.
+        """
+        try:
+            # Bus basierend auf Raspberry Pi-Version auswählen
+            bus = smbus.SMBus(1) if GPIO.RPI_REVISION > 1 else smbus.SMBus(0)
+            self.log.info("I2C-Bus für BH1750-Sensor erfolgreich geöffnet.")
+            return bus
+        except Exception as e:
+            self.log.warning("I2C-Bus für BH1750-Sensor nicht verfügbar: %s. Verwende analogen Sensor.", e)
+            return None
+
     def read_brightness(self):
         """
         Liest den Helligkeitswert vom Sensor aus.
         
+        Schlägt das Auslesen des BH1750 einmal fehl, wird für alle weiteren Messungen
+        direkt der analoge Sensor verwendet.
+        
         Returns:
             int: Der Helligkeitswert in Lux.
         """
         try:
             # Zuerst versuchen, vom BH1750-Lichtsensor zu lesen
-            try:
-                # BH1750-Konstanten
-                DEVICE = 0x5c  # Standard I2C-Geräteadresse
-                ONE_TIME_HIGH_RES_MODE_1 = 0x20  # Hochauflösungsmodus
-                
-                # Bus basierend auf Raspberry Pi-Version auswählen
-                bus = smbus.SMBus(1) if GPIO.RPI_REVISION > 1 else smbus.SMBus(0)
-                
-                # Daten vom Sensor lesen
-                data = bus.read_i2c_block_data(DEVICE, ONE_TIME_HIGH_RES_MODE_1)
-                
-                # In Lux umrechnen
-                lux = ((data[1] + (256 * data[0])) / 1.2)
-                lux_int = int(round(lux))
-                
-                self.log.info(f"Helligkeit: {lux_int} Lux (BH1750-Sensor)")
-                return lux_int
-                
-            except Exception as e:
-                # Bei Fehler auf die ursprüngliche MCP3008-Methode zurückfallen
-                self.log.warning(f"BH1750-Sensor fehlgeschlagen: {e}. Verwende analogen Sensor.")
-                
-                # Rohwert und Spannung vom MCP3008 abrufen
-                raw_value = self.brightness_channel.value
-                voltage = self.brightness_channel.voltage
-                
-                # Spannung in Lux umrechnen mit der ursprünglichen Formel
-                if voltage < 0.1:
-                    lux = 0  # Sehr dunkel
-                elif voltage < 1.0:
-                    lux = int(voltage * 1000)  # Schwaches Licht
-                else:
-                    lux = int(voltage * 2000)  # Helles Licht
+            if self.bh1750_bus is not None:
+                try:
+                    # Daten vom Sensor lesen
+                    data = self.bh1750_bus.read_i2c_block_data(self.BH1750_I2C_ADDRESS, self.BH1750_ONE_TIME_HIGH_RES_MODE_1)
+                    
+                    # In Lux umrechnen
+                    lux = ((data[1] + (256 * data[0])) / 1.2)
+                    lux_int = int(round(lux))
+                    
+                    self.log.info("Helligkeit: %d Lux (BH1750-Sensor)", lux_int)
+                    return lux_int
                     
-                self.log.info(f"Helligkeit: {lux} Lux (roh: {raw_value}, Spannung: {voltage:.2f}V)")
-                return lux
+                except Exception as e:
+                    # Fehlschlag merken und künftig direkt den analogen Sensor verwenden
+                    self.log.warning("BH1750-Sensor fehlgeschlagen: %s. Verwende ab jetzt analogen Sensor.", e)
+                    self.bh1750_bus = None
+            
+            # Nur einmal vom MCP3008 lesen und die Spannung aus dem 16-Bit-Rohwert berechnen,
+            # statt für value und voltage je eine eigene SPI-Übertragung auszulösen
+            raw_value = self.brightness_channel.value
+            voltage = raw_value * self.MCP3008_REFERENCE_VOLTAGE / 65535
+            
+            # Spannung in Lux umrechnen mit der ursprünglichen Formel
+            if voltage < 0.1:
+                lux = 0  # Sehr dunkel
+            elif voltage < 1.0:
+                lux = int(voltage * 1000)  # Schwaches Licht
+            else:
+                lux = int(voltage * 2000)  # Helles Licht
+                
+            self.log.info("Helligkeit: %d Lux (roh: %s, Spannung: %.2fV)", lux, raw_value, voltage)
+            return lux
                 
         except Exception as e:
-            self.log.error(f"Fehler beim Lesen der Helligkeit: {e}")
+            self.log.error("Fehler beim Lesen der Helligkeit: %s", e)
             return 500  # Standardwert für moderate Helligkeit
 
     def initialize_matrix_display(self):
         """
         Initialisiert das 8x8 LED-Matrix-Display mit dem MAX7219-Treiber.
         
+        Die Tag- und Nachtsymbole werden dabei einmalig als fertige Bilder vorbereitet.
+        
         Returns:
             max7219 device: Das initialisierte Matrix-Display-Objekt.
         """
         try:
             from luma.led_matrix.device import max7219
             from luma.core.interface.serial import spi, noop
+            from PIL import Image
 
             # SPI-Schnittstelle initialisieren
             serial = spi(port=0, device=1, gpio=noop())
@@ -388,17 +668,24 @@ class MeasurementSystem:
             # MAX7219-Gerät erstellen
             device = max7219(serial, cascaded=1, block_orientation=90, rotate=0)
             
+            # 1-Bit-Bilder direkt aus den Bitmaps erzeugen (ein Byte pro Zeile, höchstwertiges Bit links)
+            self._matrix_symbols = {
+                True: Image.frombytes('1', (8, 8), bytes(self.SUN_BITMAP)),
+                False: Image.frombytes('1', (8, 8), bytes(self.MOON_BITMAP)),
+            }
+            
             self.log.info("Matrix-Display erfolgreich initialisiert.")
             return device
             
         except Exception as e:
-            self.log.error(f"Fehler bei der Initialisierung des Matrix-Displays: {e}")
+            self.log.error("Fehler bei der Initialisierung des Matrix-Displays: %s", e)
             return None
 
     def display_brightness_symbol(self, brightness):
         """
         Zeigt je nach Helligkeitsstufe entweder ein Tages- oder Nachtsymbol auf dem Matrix-Display an.
-        Das Symbol bleibt sichtbar bis zum nächsten Aufruf.
+        Das Symbol bleibt sichtbar bis zum nächsten Aufruf und wird nur bei einem Wechsel
+        zwischen Tag und Nacht neu übertragen.
         
         Args:
             brightness (int): Der Helligkeitswert vom Sensor.
@@ -409,52 +696,23 @@ class MeasurementSystem:
             return
             
         try:
-            from luma.core.render import canvas
-            
-            # Sonnen- und Mond-Bitmaps (8x8) definieren
-            sun_bitmap = [
-                0b00111100,
-                0b01111110,
-                0b11111111,
-                0b11111111,
-                0b11111111,
-                0b01111110,
-                0b00111100,
-                0b00000000,
-            ]
-
-            moon_bitmap = [
-                0b00111100,
-                0b01111110,
-                0b01110000,
-                0b01100000,
-                0b01100000,
-                0b01110000,
-                0b01111110,
-                0b00111100,
-            ]
-            
             # Schwellenwert basierend auf beobachteten Messwerten anpassen
             # Da unsere Werte im Dunkeln unter 10 und mit Taschenlampe unter 300 liegen
-            is_day_mode = brightness >= 100
+            is_day_mode = brightness >= self.DAY_BRIGHTNESS_THRESHOLD
+            if is_day_mode == self._matrix_day_mode:
+                return
             
-            # Symbol zum Anzeigen auswählen
-            symbol = sun_bitmap if is_day_mode else moon_bitmap
-            
-            # Symbol mit dem Canvas zeichnen
-            with canvas(self.matrix) as draw:
-                for y in range(8):
-                    for x in range(8):
-                        if symbol[y] & (1 << (7 - x)):
-                            draw.point((x, y), fill="white")
+            # Vorbereitetes Symbol in einem Schritt übertragen
+            self.matrix.display(self._matrix_symbols[is_day_mode])
+            self._matrix_day_mode = is_day_mode
             
             if is_day_mode:
-                self.log.info(f"Tagessymbol angezeigt auf Matrix (Helligkeit: {brightness})")
+                self.log.info("Tagessymbol angezeigt auf Matrix (Helligkeit: %s)", brightness)
             else:
-                self.log.info(f"Nachtsymbol angezeigt auf Matrix (Helligkeit: {brightness})")
+                self.log.info("Nachtsymbol angezeigt auf Matrix (Helligkeit: %s)", brightness)
                 
         except Exception as e:
-            self.log.error(f"Fehler beim Anzeigen des Helligkeitssymbols: {e}")
+            self.log.error("Fehler beim Anzeigen des Helligkeitssymbols: %s", e)
 
     def initialize_seven_segment(self):
         """
@@ -465,62 +723,70 @@ class MeasurementSystem:
         """
         try:
             i2c = board.I2C()
-            display = adafruit_ht16k33.segments.Seg7x4(i2c, address=self.SEVEN_SEGMENT_I2C_ADDRESS)
+            # Ohne auto_write werden Änderungen nur gepuffert und erst mit show() in einem
+            # einzigen I2C-Schreibvorgang übertragen
+            display = adafruit_ht16k33.segments.Seg7x4(i2c, address=self.SEVEN_SEGMENT_I2C_ADDRESS, auto_write=False)
             display.fill(0)  # Display löschen
+            display.show()
             display.brightness = 0.5  # Mittlere Helligkeit
             self.log.info("7-Segment-Display erfolgreich initialisiert.")
             return display
         except Exception as e:
-            self.log.error(f"Fehler bei der Initialisierung des 7-Segment-Displays: {e}")
+            self.log.error("Fehler bei der Initialisierung des 7-Segment-Displays: %s", e)
             return None
 
-    def display_measurements_on_seven_segment(self, temperature, humidity):
+    def display_measurements_on_seven_segment(self, temperature, humidity, show_humidity: bool = False):
         """
-        Zeigt Temperatur und Luftfeuchtigkeit abwechselnd auf dem 7-Segment-Display an.
-        Zeigt Temperatur mit 'C'-Suffix, dann Luftfeuchtigkeit mit '%'-Suffix.
+        Zeigt Temperatur oder Luftfeuchtigkeit auf dem 7-Segment-Display an.
+        Zeigt Temperatur mit 'C'-Suffix bzw. Luftfeuchtigkeit mit '%'-Suffix.
+        
+        Der Wechsel zwischen beiden Werten erfolgt im Anzeige-Thread (siehe
+        submit_display_update), damit die Messschleife nicht blockiert wird.
         
         Args:
             temperature (float): Die gemessene Temperatur.
             humidity (float): Die gemessene Luftfeuchtigkeit.
+            show_humidity (bool): Luftfeuchtigkeit statt Temperatur anzeigen.
         """
         if self.seven_segment is None:
-            self.log.warning("7-Segment-Display ist nicht verfügbar.")
+            # Wird im Sekundentakt aufgerufen; fehlende Hardware daher nur einmal melden
+            if not self._seven_segment_warned:
+                self.log.warning("7-Segment-Display ist nicht verfügbar.")
+                self._seven_segment_warned = True
             return
             
         try:
-            # Zuerst Temperatur mit C-Suffix anzeigen
-            self.seven_segment.fill(0)  # Display löschen
-            
-            # Temperatur für Anzeige formatieren mit einer Dezimalstelle und 'C'-Suffix
-            if temperature < 0 and temperature > -10:  # Negative einstellige Zahl
-                temp_str = f"{temperature:.1f}"  # Zeigt etwa "-5.2"
-            elif temperature < 10 and temperature >= 0:  # Positive einstellige Zahl
-                temp_str = f"{temperature:.1f}C"  # Zeigt etwa "5.2C"
-            elif temperature < 100:  # Zweistellige Zahl
-                temp_str = f"{temperature:.0f}C"  # Zeigt etwa "25C"
-            else:
-                temp_str = "99C"  # Maximal anzeigbare Temperatur
-                
-            self.seven_segment.print(temp_str)
-            self.log.info(f"7-Segment-Display zeigt Temperatur: {temp_str}")
-            time.sleep(1.0)  # Temperatur 1 Sekunde lang anzeigen
+            self.seven_segment.fill(0)  # Puffer löschen
             
-            # Dann Luftfeuchtigkeit anzeigen
-            self.seven_segment.fill(0)  # Display löschen
-            
-            # Luftfeuchtigkeit für Anzeige formatieren mit einer Dezimalstelle und '%'-Suffix
-            if humidity < 10:
-                hum_str = f"{humidity:.1f}%"  # Zeigt etwa "5.2%"
-            elif humidity < 100:
-                hum_str = f"{humidity:.0f}%"  # Zeigt etwa "45%"
+            if not show_humidity:
+                # Temperatur für Anzeige formatieren mit einer Dezimalstelle und 'C'-Suffix
+                if temperature < 0 and temperature > -10:  # Negative einstellige Zahl
+                    temp_str = f"{temperature:.1f}"  # Zeigt etwa "-5.2"
+                elif temperature < 10 and temperature >= 0:  # Positive einstellige Zahl
+                    temp_str = f"{temperature:.1f}C"  # Zeigt etwa "5.2C"
+                elif temperature < 100:  # Zweistellige Zahl
+                    temp_str = f"{temperature:.0f}C"  # Zeigt etwa "25C"
+                else:
+                    temp_str = "99C"  # Maximal anzeigbare Temperatur
+                    
+                self.seven_segment.print(temp_str)
+                self.seven_segment.show()  # Gesamten Puffer in einem Schritt übertragen
+                self.log.debug("7-Segment-Display zeigt Temperatur: %s", temp_str)
             else:
-                hum_str = "99%"  # Maximal anzeigbare Luftfeuchtigkeit
-                
-            self.seven_segment.print(hum_str)
-            self.log.info(f"7-Segment-Display zeigt Luftfeuchtigkeit: {hum_str}")
+                # Luftfeuchtigkeit für Anzeige formatieren mit einer Dezimalstelle und '%'-Suffix
+                if humidity < 10:
+                    hum_str = f"{humidity:.1f}%"  # Zeigt etwa "5.2%"
+                elif humidity < 100:
+                    hum_str = f"{humidity:.0f}%"  # Zeigt etwa "45%"
+                else:
+                    hum_str = "99%"  # Maximal anzeigbare Luftfeuchtigkeit
+                    
+                self.seven_segment.print(hum_str)
+                self.seven_segment.show()  # Gesamten Puffer in einem Schritt übertragen
+                self.log.debug("7-Segment-Display zeigt Luftfeuchtigkeit: %s", hum_str)
             
         except Exception as e:
-            self.log.error(f"Fehler bei der Anzeige auf 7-Segment-Display: {e}")
+            self.log.error("Fehler bei der Anzeige auf 7-Segment-Display: %s", e)
 
     def update_all_displays(self, temp: float, hum: float, brightness: int) -> None:
         """
@@ -538,10 +804,102 @@ class MeasurementSystem:
             # 2. Helligkeitssymbol auf Matrix-Display anzeigen
             self.display_brightness_symbol(brightness)
             
-            # 3. Messwerte auf 7-Segment-Display anzeigen
+            # 3. Temperatur auf 7-Segment-Display anzeigen
             self.display_measurements_on_seven_segment(temp, hum)
             
             self.log.info("Alle Anzeigen erfolgreich aktualisiert")
             
         except Exception as e:
-            self.log.error(f"Fehler beim Aktualisieren der Anzeigen: {e}")
+            self.log.error("Fehler beim Aktualisieren der Anzeigen: %s", e)
+
+    def submit_display_update(self, temp: float, hum: float, brightness: int) -> None:
+        """
+        Übergibt neue Messwerte an den Anzeige-Thread, ohne auf die Displays zu warten.
+        
+        Der Thread wird beim ersten Aufruf gestartet. Noch nicht angezeigte ältere
+        Werte werden verworfen, da nur der aktuellste Stand relevant ist. Haben sich die
+        Werte seit der letzten Anzeige kaum verändert, wird auf eine Neuanzeige verzichtet.
+        
+        Args:
+            temp (float): Die gemessene Temperatur.
+            hum (float): Die gemessene Luftfeuchtigkeit.
+            brightness (int): Die gemessene Helligkeit.
+        """
+        if self._display_thread is None:
+            self._display_thread = threading.Thread(target=self._display_worker, name='display', daemon=True)
+            self._display_thread.start()
+        values = (temp, hum, brightness)
+        if not self._display_values_changed(values):
+            return
+        self._last_display_values = values
+        self._replace_display_values(values)
+
+    def _display_values_changed(self, values) -> bool:
+        """
+        Prüft, ob sich die Messwerte seit der letzten Anzeige sichtbar verändert haben.
+        
+        Args:
+            values: Tupel (Temperatur, Luftfeuchtigkeit, Helligkeit).
+        
+        Returns:
+            bool: True, wenn die Anzeigen aktualisiert werden sollten.
+        """
+        if self._last_display_values is None:
+            return True
+        temp, hum, brightness = values
+        last_temp, last_hum, last_brightness = self._last_display_values
+        if None in (temp, hum, last_temp, last_hum):
+            return (temp, hum) != (last_temp, last_hum)
+        if abs(temp - last_temp) >= self.DISPLAY_TEMP_EPSILON or abs(hum - last_hum) >= self.DISPLAY_HUM_EPSILON:
+            return True
+        # Beim Helligkeitswert zählt nur ein Wechsel zwischen Tag- und Nachtsymbol
+        if brightness is None or last_brightness is None:
+            return brightness is not last_brightness
+        return (brightness >= self.DAY_BRIGHTNESS_THRESHOLD) != (last_brightness >= self.DAY_BRIGHTNESS_THRESHOLD)
+
+    def stop_display_worker(self) -> None:
+        """
+        Beendet den Anzeige-Thread, falls er läuft.
+        """
+        if self._display_thread is None:
+            return
+        self._replace_display_values(None)
+        self._display_thread.join(timeout=5.0)
+        self._display_thread = None
+
+    def _replace_display_values(self, values) -> None:
+        """
+        Ersetzt den Inhalt der Anzeige-Warteschlange durch die neuen Werte.
+        
+        Args:
+            values: Tupel (Temperatur, Luftfeuchtigkeit, Helligkeit) oder None zum Beenden.
+        """
+        try:
+            self._display_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._display_queue.put_nowait(values)
+
+    def _display_worker(self) -> None:
+        """
+        Aktualisiert die Displays im Hintergrund und wechselt auf dem 7-Segment-Display
+        im Abstand von SEVEN_SEGMENT_TOGGLE_INTERVAL zwischen Temperatur und Luftfeuchtigkeit.
+        """
+        values = None
+        show_humidity = False
+        next_toggle = None
+        while True:
+            timeout = None if next_toggle is None else max(0.0, next_toggle - time.monotonic())
+            try:
+                new_values = self._display_queue.get(timeout=timeout)
+            except queue.Empty:
+                # Keine neuen Messwerte: zwischen Temperatur und Luftfeuchtigkeit wechseln
+                show_humidity = not show_humidity
+                self.display_measurements_on_seven_segment(values[0], values[1], show_humidity)
+            else:
+                if new_values is None:
+                    break
+                values = new_values
+                self.update_all_displays(*values)
+                show_humidity = False
+            next_toggle = time.monotonic() + self.SEVEN_SEGMENT_TOGGLE_INTERVAL
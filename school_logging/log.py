@@ -6,7 +6,7 @@ Dieses Modul stellt erweiterte Protokollierungsfunktionen bereit, die für die
 
 Es bietet:
 - Farbige Konsolenausgabe für verschiedene Protokollierungsstufen
-- Automatische Speicherung aller Protokolle in Dateien mit Zeitstempeln
+- Automatische Speicherung aller Protokolle in rotierenden Dateien mit begrenzter Größe
 - Programmbeendigung bei kritischen Fehlern
 - Anpassbare Protokollierungsstufen über Befehlszeilenargumente
 
@@ -15,10 +15,10 @@ und hilft bei der effektiven Überwachung des Systems im Betrieb und bei der Feh
 """
 
 import logging
+import logging.handlers
 import sys
 import os
 import argparse
-from datetime import datetime
 from typing import Dict, Any
 
 # Farben für die verschiedenen Log-Stufen definieren
@@ -33,6 +33,12 @@ LOG_COLORS: Dict[str, str] = {
 # Farbe zurücksetzen
 RESET_COLOR: str = '\033[0m'
 
+# Protokollverzeichnis und Rotation (je Logger-Name eine Datei <name>.log, maximal
+# LOG_FILE_BACKUP_COUNT + 1 Dateien zu je LOG_FILE_MAX_BYTES)
+LOG_DIR: str = 'logging'
+LOG_FILE_MAX_BYTES: int = 1024 * 1024
+LOG_FILE_BACKUP_COUNT: int = 5
+
 class CriticalExitHandler(logging.Handler):
     """
     Benutzerdefinierter Handler, der das Programm beendet, wenn ein Log der Stufe CRITICAL erzeugt wird.
@@ -56,9 +62,10 @@ class ColoredFormatter(logging.Formatter):
         self.colored = colored
 
     def format(self, record: logging.LogRecord) -> str:
-        log_color = LOG_COLORS.get(record.levelname, RESET_COLOR)
         message = super().format(record)
-        return f"{log_color}{message}{RESET_COLOR}" if self.colored else message
+        if not self.colored:
+            return message
+        return LOG_COLORS.get(record.levelname, RESET_COLOR) + message + RESET_COLOR
 
 class ColoredLogger:
     """
@@ -111,12 +118,16 @@ class ColoredLogger:
             ))
             logger.addHandler(ch)
 
-            # Dateihandler (alle Stufen, keine Farben, gespeichert mit Zeitstempel)
-            log_dir = 'logging'
-            os.makedirs(log_dir, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            log_file_path = os.path.join(log_dir, f'logs_{timestamp}.log')
-            fh = logging.FileHandler(log_file_path)
+            # Dateihandler (alle Stufen, keine Farben); eine fortlaufende Datei pro Logger-Name,
+            # die bei Erreichen der Maximalgröße rotiert wird, statt einer neuen Datei pro Programmstart.
+            # Jeder Name erhält eine eigene Datei, damit nie zwei Handler dieselbe Datei rotieren.
+            os.makedirs(LOG_DIR, exist_ok=True)
+            fh = logging.handlers.RotatingFileHandler(
+                os.path.join(LOG_DIR, f'{self.name}.log'),
+                maxBytes=LOG_FILE_MAX_BYTES,
+                backupCount=LOG_FILE_BACKUP_COUNT,
+                delay=True
+            )
             fh.setLevel(logging.DEBUG)
             fh.setFormatter(ColoredFormatter(
                 '%(asctime)s - %(filename)s - %(name)s - [%(levelname)s] - %(message)s',
@@ -138,6 +149,8 @@ class ColoredLogger:
             *args: Zusätzliche Positionsargumente für die Formatierung
             **kwargs: Zusätzliche Schlüsselwortargumente für die Formatierung
         """
+        # stacklevel=2: Dateiname des Aufrufers statt dieses Wrappers protokollieren
+        kwargs.setdefault('stacklevel', 2)
         self.logger.debug(msg, *args, **kwargs)
 
     def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
@@ -149,6 +162,7 @@ class ColoredLogger:
             *args: Zusätzliche Positionsargumente für die Formatierung
             **kwargs: Zusätzliche Schlüsselwortargumente für die Formatierung
         """
+        kwargs.setdefault('stacklevel', 2)
         self.logger.info(msg, *args, **kwargs)
 
     def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
@@ -160,6 +174,7 @@ class ColoredLogger:
             *args: Zusätzliche Positionsargumente für die Formatierung
             **kwargs: Zusätzliche Schlüsselwortargumente für die Formatierung
         """
+        kwargs.setdefault('stacklevel', 2)
         self.logger.warning(msg, *args, **kwargs)
 
     def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
@@ -171,6 +186,7 @@ class ColoredLogger:
             *args: Zusätzliche Positionsargumente für die Formatierung
             **kwargs: Zusätzliche Schlüsselwortargumente für die Formatierung
         """
+        kwargs.setdefault('stacklevel', 2)
         self.logger.error(msg, *args, **kwargs)
 
     def critical(self, msg: str, *args: Any, **kwargs: Any) -> None:
@@ -183,6 +199,7 @@ class ColoredLogger:
             *args: Zusätzliche Positionsargumente für die Formatierung
             **kwargs: Zusätzliche Schlüsselwortargumente für die Formatierung
         """
+        kwargs.setdefault('stacklevel', 2)
         self.logger.critical(msg, *args, **kwargs)
 
     def _map_log_level(self, verbose: str) -> int:
@@ -0,0 +1,92 @@
+"""
+Tests für die NTP-Zeitermittlung in greenhouse.messdaten.
+
+Die Hardware-Bibliotheken des Raspberry Pi sind auf Entwicklungsrechnern meist nicht
+installiert; fehlende Module werden daher vor dem Import durch Platzhalter ersetzt.
+"""
+
+import importlib
+import logging
+import socket
+import sys
+import time
+import types
+import unittest
+from unittest import mock
+
+
+def _ensure_module(name: str, module=None) -> None:
+    """Registriert einen Platzhalter für ein nicht installiertes Modul."""
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        sys.modules[name] = module if module is not None else mock.MagicMock(name=name)
+
+
+for _name in ['RPi', 'RPi.GPIO', 'board', 'digitalio', 'busio',
+              'adafruit_character_lcd', 'adafruit_character_lcd.character_lcd_i2c',
+              'adafruit_mcp3xxx', 'adafruit_mcp3xxx.mcp3008', 'adafruit_mcp3xxx.analog_in',
+              'adafruit_ht16k33', 'adafruit_ht16k33.segments', 'smbus']:
+    _ensure_module(_name)
+
+_ntplib_stub = types.ModuleType('ntplib')
+_ntplib_stub.NTPException = type('NTPException', (Exception,), {})
+_ntplib_stub.NTPClient = mock.MagicMock
+_ensure_module('ntplib', _ntplib_stub)
+
+from greenhouse.messdaten import MeasurementSystem  # noqa: E402
+
+
+class GetNtpTimeTest(unittest.TestCase):
+    """Tests für MeasurementSystem.get_ntp_time."""
+
+    REQUEST_DURATION = 0.5  # Simulierte Dauer einer fehlgeschlagenen NTP-Anfrage in Sekunden
+
+    def setUp(self):
+        # Nur die von get_ntp_time benötigten Attribute setzen, ohne Hardware oder Datenbank
+        self.system = MeasurementSystem.__new__(MeasurementSystem)
+        self.system.log = logging.getLogger('test_messdaten')
+        self.system._ntp_offset = None
+        self.system._ntp_next_sync = 0.0
+
+    def _failing_request(self, ip_address):
+        time.sleep(self.REQUEST_DURATION)
+        raise socket.timeout('timed out')
+
+    def test_fallback_timestamp_matches_local_clock_after_slow_failure(self):
+        with mock.patch.object(self.system, '_request_ntp', side_effect=self._failing_request):
+            timestamp = self.system.get_ntp_time('192.0.2.1')
+            self.assertAlmostEqual(timestamp / 1000, time.time(), delta=0.1)
+
+            # Auch spätere Zeitstempel dürfen die Dauer der fehlgeschlagenen Anfrage nicht enthalten
+            later = self.system.get_ntp_time('192.0.2.1')
+            self.assertAlmostEqual(later / 1000, time.time(), delta=0.1)
+
+    def test_retry_is_scheduled_from_end_of_failed_request(self):
+        with mock.patch.object(self.system, '_request_ntp', side_effect=self._failing_request):
+            self.system.get_ntp_time('192.0.2.1')
+        expected = time.monotonic() + MeasurementSystem.NTP_RETRY_INTERVAL
+        self.assertAlmostEqual(self.system._ntp_next_sync, expected, delta=0.1)
+
+
+
+class SaveMeasurementsTest(unittest.TestCase):
+    """Tests für MeasurementSystem.save_measurements."""
+
+    def test_empty_rows_without_connection_is_not_an_error(self):
+        system = MeasurementSystem.__new__(MeasurementSystem)
+        system.log = mock.Mock()
+        system.conn = None
+        self.assertTrue(system.save_measurements([]))
+        system.log.error.assert_not_called()
+
+    def test_rows_without_connection_fail(self):
+        system = MeasurementSystem.__new__(MeasurementSystem)
+        system.log = mock.Mock()
+        system.conn = None
+        self.assertFalse(system.save_measurements([(0, 20.0, 50.0, 100)]))
+        system.log.error.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()